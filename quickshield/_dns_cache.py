@@ -0,0 +1,86 @@
+from __future__ import annotations
+from time import monotonic
+from typing import Dict, Optional, Tuple
+import asyncio
+import ipaddress
+import socket
+import dns.asyncresolver
+import dns.resolver
+
+# Answers are kept for their record TTL, but never longer than this (seconds)
+MAX_TTL = 300
+# How long "no such name" / "no records of this type" is remembered
+NEGATIVE_TTL = 30
+
+# Pseudo record type for the OS resolver's answer (getaddrinfo: /etc/hosts, nsswitch, ...)
+_SYSTEM = "system"
+
+_Key = Tuple[str, str]
+
+class DnsCache:
+    """TTL-respecting cache in front of dnspython's async resolver and getaddrinfo.
+
+    Keyed on (host, rdtype). Expired entries are dropped lazily on lookup, and
+    concurrent lookups for the same key share a single query.
+    """
+
+    def __init__(self, max_ttl: int = MAX_TTL, negative_ttl: int = NEGATIVE_TTL) -> None:
+        self._max_ttl = max_ttl
+        self._negative_ttl = negative_ttl
+        self._entries: Dict[_Key, Tuple[float, Tuple[str, ...]]] = {}
+        self._inflight: Dict[_Key, asyncio.Task[Tuple[str, ...]]] = {}
+        self._resolver: Optional[dns.asyncresolver.Resolver] = None
+
+    async def resolve(self, host: str, rdtype: str) -> Tuple[str, ...]:
+        key = (host.lower().rstrip("."), rdtype)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, answers = entry
+            if expires > monotonic():
+                return answers
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._query(key))
+            self._inflight[key] = task
+        # shield: one caller being cancelled must not cancel the shared query
+        return await asyncio.shield(task)
+
+    async def addresses(self, host: str) -> Tuple[str, ...]:
+        """Every address the OS resolver gives for `host`, in its preferred order.
+
+        Uses getaddrinfo, so /etc/hosts and split-horizon setups behave as they do for
+        any other program; the answer (which carries no TTL) is kept for max_ttl.
+        Raises OSError if the name doesn't resolve.
+        """
+        try:
+            ipaddress.ip_address(host)
+            return (host,)
+        except ValueError:
+            pass
+        return await self.resolve(host, _SYSTEM)
+
+    async def _query(self, key: _Key) -> Tuple[str, ...]:
+        host, rdtype = key
+        try:
+            if rdtype == _SYSTEM:
+                infos = await asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+                answers = tuple(dict.fromkeys(info[4][0] for info in infos))
+                self._entries[key] = (monotonic() + self._max_ttl, answers)
+                return answers
+            if self._resolver is None:
+                self._resolver = dns.asyncresolver.Resolver(configure=True)
+            try:
+                answer = await self._resolver.resolve(host, rdtype)
+                answers = tuple(str(r).strip() for r in answer)
+                ttl = min(answer.rrset.ttl, self._max_ttl) if answer.rrset is not None else 0
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                answers, ttl = (), self._negative_ttl
+            self._entries[key] = (monotonic() + ttl, answers)
+            return answers
+        finally:
+            self._inflight.pop(key, None)
+
+# Process-wide cache shared by the DNS check and the HTTP client's transport
+DNS_CACHE = DnsCache()
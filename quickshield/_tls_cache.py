@@ -0,0 +1,76 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import ssl
+
+_SSL_CONTEXT: Optional[ssl.SSLContext] = None
+
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+@dataclass(frozen=True, slots=True)
+class PeerCert:
+    """The parts of a verified leaf certificate the SSL check reports on."""
+    fingerprint: str                # SHA-256 of the leaf certificate (DER)
+    not_after: Optional[datetime]
+    issuer: Optional[str]
+
+# Verified leaf certificates seen on TLS handshakes, keyed by (server hostname, port).
+# Every URL on the same host:port shares one entry, so the chain is checked once.
+_PEER_CERTS: Dict[Tuple[str, int], PeerCert] = {}
+
+def _parse_cert_time(value: Optional[str]) -> Optional[datetime]:
+    # Typical format from getpeercert(): 'Oct  1 12:00:00 2025 GMT'
+    # (always English month names and GMT, so no need for locale-aware strptime)
+    if not value:
+        return None
+    month, day, clock, year, _tz = value.split()
+    hour, minute, second = clock.split(":")
+    return datetime(
+        int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second), tzinfo=timezone.utc
+    )
+
+def _issuer_name(cert: Dict[str, Any]) -> Optional[str]:
+    # issuer is a tuple of ((('commonName', 'X'),), (('organizationName','Y'),) ...)
+    issuer_parts = []
+    for rdn in cert.get("issuer") or []:
+        for k, v in rdn:
+            if k.lower() in ("commonname", "organizationname", "countryname"):
+                issuer_parts.append(v)
+    return ", ".join(issuer_parts) if issuer_parts else None
+
+def remember_peer_cert(host: str, port: int, ssl_object: Any) -> Optional[PeerCert]:
+    """Record the leaf certificate of a completed handshake (an SSLObject or SSLSocket)."""
+    der = ssl_object.getpeercert(binary_form=True)
+    if not der:
+        return None
+    fingerprint = hashlib.sha256(der).hexdigest()
+    key = (host.lower(), port)
+    cached = _PEER_CERTS.get(key)
+    if cached is not None and cached.fingerprint == fingerprint:
+        return cached  # same leaf as before: nothing to re-parse
+    cert = ssl_object.getpeercert() or {}
+    entry = PeerCert(
+        fingerprint=fingerprint,
+        not_after=_parse_cert_time(cert.get("notAfter")),
+        issuer=_issuer_name(cert),
+    )
+    _PEER_CERTS[key] = entry
+    return entry
+
+def lookup_peer_cert(host: str, port: int) -> Optional[PeerCert]:
+    return _PEER_CERTS.get((host.lower(), port))
+
+def get_ssl_context() -> ssl.SSLContext:
+    """One verifying SSLContext shared by the HTTP client and the SSL check.
+
+    Built on first use: loading the CA bundle is the expensive part of TLS setup.
+    """
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        _SSL_CONTEXT = ssl.create_default_context()
+    return _SSL_CONTEXT
@@ -0,0 +1,119 @@
+from __future__ import annotations
+from typing import Any, Iterable, Optional
+import ssl
+import httpcore
+import httpx
+
+from ._dns_cache import DnsCache
+from ._tls_cache import remember_peer_cert
+
+class _CertRecordingStream(httpcore.AsyncNetworkStream):
+    """Pass-through stream that records the peer certificate after the TLS handshake."""
+
+    def __init__(self, stream: httpcore.AsyncNetworkStream, port: int) -> None:
+        self._stream = stream
+        self._port = port
+
+    async def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        return await self._stream.read(max_bytes, timeout=timeout)
+
+    async def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        await self._stream.write(buffer, timeout=timeout)
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+    async def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        server_hostname: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        tls_stream = await self._stream.start_tls(
+            ssl_context, server_hostname=server_hostname, timeout=timeout
+        )
+        ssl_object = tls_stream.get_extra_info("ssl_object")
+        if ssl_object is not None and server_hostname:
+            # Caching is best effort: an odd certificate must not fail a request that worked
+            try:
+                remember_peer_cert(server_hostname, self._port, ssl_object)
+            except Exception:
+                pass
+        return tls_stream
+
+    def get_extra_info(self, info: str) -> Any:
+        return self._stream.get_extra_info(info)
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Resolve hostnames through a DnsCache before connecting.
+
+    Only the TCP connect target changes; TLS SNI and certificate checks still
+    use the URL's hostname. Addresses come from the OS resolver (cached), and
+    are tried in order until one accepts the connection. Streams record their
+    peer certificate so the SSL check can reuse it.
+    """
+
+    def __init__(self, cache: DnsCache, backend: Optional[httpcore.AsyncNetworkBackend] = None) -> None:
+        self._cache = cache
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self._cache.addresses(host)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+        error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                stream = await self._backend.connect_tcp(
+                    address, port,
+                    timeout=timeout, local_address=local_address, socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e  # one dead address shouldn't fail the site; try the next
+                continue
+            return _CertRecordingStream(stream, port)
+        raise error or httpcore.ConnectError(f"No addresses found for {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+class CachingTransport(httpx.AsyncHTTPTransport):
+    """AsyncHTTPTransport whose connections resolve hosts through a DnsCache."""
+
+    def __init__(
+        self,
+        cache: DnsCache,
+        ssl_context: ssl.SSLContext,
+        http2: bool = False,
+        limits: httpx.Limits = httpx.Limits(),
+    ) -> None:
+        super().__init__(verify=ssl_context, http2=http2, limits=limits)
+        # httpx has no network_backend option, so replace the pool it just built with an
+        # equivalent one that has ours. `_pool` is a private httpx attribute, as is
+        # httpx._utils.get_environment_proxies (used in runner.py): both are why
+        # pyproject pins httpx to the minor versions this was tested on (0.27-0.28).
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=ssl_context,
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=CachingNetworkBackend(cache),
+        )
@@ -1,10 +1,15 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
+import asyncio
+import contextlib
 import hashlib
-import dns.resolver
 
-@dataclass
+from .._dns_cache import DNS_CACHE
+
+_RECORD_TYPES = ("A", "AAAA", "CNAME", "MX")
+
+@dataclass(slots=True)
 class DnsCheckResult:
     name: str
     host: str
@@ -14,26 +19,48 @@ class DnsCheckResult:
     error: Optional[str]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "host": self.host,
+            "ok": self.ok,
+            "records": self.records,
+            "hash": self.hash,
+            "error": self.error,
+        }
 
-def _resolve_records(host: str, record_type: str) -> List[str]:
+async def _resolve_records(
+    host: str, record_type: str, query_slots: Optional[asyncio.Semaphore]
+) -> List[str]:
     try:
-        answers = dns.resolver.resolve(host, record_type)
-        return sorted([str(r).strip() for r in answers])
+        async with query_slots or contextlib.nullcontext():
+            answers = await DNS_CACHE.resolve(host, record_type)
+        return sorted(answers)
     except Exception:
         return []
 
-def run_dns_check(name: str, host: str) -> DnsCheckResult:
+def _records_digest(recs: Dict[str, List[str]]) -> str:
+    # SHA-256 of "A:...|AAAA:...|CNAME:...|MX:..." (types sorted), fed incrementally.
+    # Kept as SHA-256 so hashes stay comparable with earlier reports.
+    h = hashlib.sha256()
+    sep = b""
+    for rtype in sorted(recs):
+        h.update(sep)
+        h.update(f"{rtype}:{','.join(recs[rtype])}".encode("utf-8"))
+        sep = b"|"
+    return h.hexdigest()
+
+async def run_dns_check(
+    name: str, host: str, query_slots: Optional[asyncio.Semaphore] = None
+) -> DnsCheckResult:
+    # `query_slots` caps DNS queries in flight across all hosts of a run
     try:
-        recs: Dict[str, List[str]] = {}
-        for rtype in ("A", "AAAA", "CNAME", "MX"):
-            recs[rtype] = _resolve_records(host, rtype)
-
-        combined = []
-        for k, v in sorted(recs.items()):
-            combined.append(k + ":" + ",".join(v))
-        combined_str = "|".join(combined)
-        digest = hashlib.sha256(combined_str.encode("utf-8")).hexdigest()
+        # All record types at once; a failed lookup comes back as []
+        answers = await asyncio.gather(
+            *(_resolve_records(host, rtype, query_slots) for rtype in _RECORD_TYPES)
+        )
+        recs: Dict[str, List[str]] = dict(zip(_RECORD_TYPES, answers))
+
+        digest = _records_digest(recs)
 
         ok = any(recs.values())  # if at least one record resolves, we call it ok
         return DnsCheckResult(
@@ -1,9 +1,10 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, FrozenSet, List, Mapping, Optional, Tuple
+import re
 import httpx
 
-@dataclass
+@dataclass(slots=True)
 class HeadersCheckResult:
     name: str
     url: str
@@ -14,111 +15,120 @@ class HeadersCheckResult:
     error: Optional[str]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
-
-def _lower_keys(headers: httpx.Headers) -> Dict[str, str]:
-    # normalize to lowercase dict[str,str]
-    return {k.lower(): v for k, v in headers.items()}
-
-def _score(headers: Dict[str, str]) -> Tuple[str, List[str]]:
-    issues: List[str] = []
+        return {
+            "name": self.name,
+            "url": self.url,
+            "ok": self.ok,
+            "grade": self.grade,
+            "issues": self.issues,
+            "sample": self.sample,
+            "error": self.error,
+        }
 
-    # --- Strict-Transport-Security (HSTS)
+# Minimum HSTS max-age we accept (~180 days)
+_HSTS_MIN = 15552000
+# max-age must start a ";"-separated directive; RFC 6797 allows a quoted value
+_HSTS_MAX_AGE = re.compile(r'(?i)(?:^|;)\s*max-age\s*=\s*"?(\d+)"?')
+
+_GOOD_XFO: FrozenSet[str] = frozenset({"deny", "sameorigin"})
+_GOOD_RP: FrozenSet[str] = frozenset({
+    "no-referrer",
+    "no-referrer-when-downgrade",
+    "strict-origin",
+    "strict-origin-when-cross-origin",
+    "same-origin",
+    "origin",
+    "origin-when-cross-origin",
+})
+
+def _check_hsts(headers: Mapping[str, str]) -> Optional[str]:
     hsts = headers.get("strict-transport-security")
     if not hsts:
-        issues.append("Missing Strict-Transport-Security")
-    else:
-        # Simple parse: look for max-age >= 15552000 (~180 days)
-        max_age_ok = False
-        try:
-            parts = [p.strip() for p in hsts.split(";")]
-            for p in parts:
-                if p.lower().startswith("max-age="):
-                    val = int(p.split("=", 1)[1])
-                    if val >= 15552000:
-                        max_age_ok = True
-                        break
-            if not max_age_ok:
-                issues.append("HSTS max-age < 15552000")
-        except Exception:
-            issues.append("HSTS not parseable")
-
-    # --- Content-Security-Policy (CSP)
-    csp = headers.get("content-security-policy")
-    if not csp:
-        issues.append("Missing Content-Security-Policy")
-
-    # --- X-Content-Type-Options
-    xcto = headers.get("x-content-type-options")
-    if (xcto or "").lower() != "nosniff":
-        issues.append("X-Content-Type-Options not 'nosniff'")
-
-    # --- X-Frame-Options
-    xfo = (headers.get("x-frame-options") or "").lower()
-    if xfo not in ("deny", "sameorigin"):
-        issues.append("X-Frame-Options not DENY/SAMEORIGIN")
-
-    # --- Referrer-Policy
-    rp = (headers.get("referrer-policy") or "").lower()
-    good_rp = {
-        "no-referrer",
-        "no-referrer-when-downgrade",
-        "strict-origin",
-        "strict-origin-when-cross-origin",
-        "same-origin",
-        "origin",
-        "origin-when-cross-origin",
+        return "Missing Strict-Transport-Security"
+    m = _HSTS_MAX_AGE.search(hsts)
+    if m is None:
+        return "HSTS not parseable" if "max-age" in hsts.lower() else "HSTS max-age < 15552000"
+    if int(m.group(1)) < _HSTS_MIN:
+        return "HSTS max-age < 15552000"
+    return None
+
+def _check_csp(headers: Mapping[str, str]) -> Optional[str]:
+    return None if headers.get("content-security-policy") else "Missing Content-Security-Policy"
+
+def _check_xcto(headers: Mapping[str, str]) -> Optional[str]:
+    if (headers.get("x-content-type-options") or "").lower() != "nosniff":
+        return "X-Content-Type-Options not 'nosniff'"
+    return None
+
+def _check_xfo(headers: Mapping[str, str]) -> Optional[str]:
+    if (headers.get("x-frame-options") or "").lower() not in _GOOD_XFO:
+        return "X-Frame-Options not DENY/SAMEORIGIN"
+    return None
+
+def _check_rp(headers: Mapping[str, str]) -> Optional[str]:
+    if (headers.get("referrer-policy") or "").lower() not in _GOOD_RP:
+        return "Referrer-Policy missing or lax"
+    return None
+
+def _check_pp(headers: Mapping[str, str]) -> Optional[str]:
+    # Permissions-Policy (formerly Feature-Policy)
+    if headers.get("permissions-policy") or headers.get("feature-policy"):
+        return None
+    return "Missing Permissions-Policy"
+
+# Each rule returns an issue message, or None if the header is fine
+_RULES: Tuple[Callable[[Mapping[str, str]], Optional[str]], ...] = (
+    _check_hsts, _check_csp, _check_xcto, _check_xfo, _check_rp, _check_pp,
+)
+
+# Grade: A (0–1 issues), B (2–3), C (4–5), F (6+)
+_GRADES = ("A", "A", "B", "B", "C", "C")
+
+def _score(headers: Mapping[str, str]) -> Tuple[str, List[str]]:
+    issues = [msg for rule in _RULES if (msg := rule(headers))]
+    n = len(issues)
+    grade = _GRADES[n] if n < len(_GRADES) else "F"
+    return grade, issues
+
+def evaluate_headers(name: str, url: str, hdrs: httpx.Headers) -> HeadersCheckResult:
+    # httpx.Headers lookups are already case-insensitive
+    grade, issues = _score(hdrs)
+
+    sample = {
+        "strict-transport-security": hdrs.get("strict-transport-security", ""),
+        "content-security-policy": hdrs.get("content-security-policy", ""),
+        "x-content-type-options": hdrs.get("x-content-type-options", ""),
+        "x-frame-options": hdrs.get("x-frame-options", ""),
+        "referrer-policy": hdrs.get("referrer-policy", ""),
+        "permissions-policy": hdrs.get("permissions-policy", hdrs.get("feature-policy", "")),
     }
-    if rp not in good_rp:
-        issues.append("Referrer-Policy missing or lax")
 
-    # --- Permissions-Policy (formerly Feature-Policy)
-    pp = headers.get("permissions-policy") or headers.get("feature-policy")
-    if not pp:
-        issues.append("Missing Permissions-Policy")
+    ok = grade in ("A", "B")  # treat C/F as not ok
+    return HeadersCheckResult(
+        name=name, url=url, ok=ok, grade=grade, issues=issues, sample=sample, error=None
+    )
 
-    # Grade: A (0–1 issues), B (2–3), C (4–5), F (6+)
-    n = len(issues)
-    if n <= 1:
-        grade = "A"
-    elif n <= 3:
-        grade = "B"
-    elif n <= 5:
-        grade = "C"
-    else:
-        grade = "F"
+def headers_error_result(name: str, url: str, error: Exception) -> HeadersCheckResult:
+    return HeadersCheckResult(
+        name=name, url=url, ok=False, grade="F", issues=["exception"], sample={}, error=str(error)
+    )
 
-    return grade, issues
+async def _get_headers_only(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    # GET fallback: close the stream once headers arrive, never reading the body
+    async with client.stream("GET", url) as resp:
+        return resp
 
-def run_headers_check(name: str, url: str) -> HeadersCheckResult:
+async def run_headers_check(client: httpx.AsyncClient, name: str, url: str) -> HeadersCheckResult:
     try:
-        with httpx.Client(follow_redirects=True, timeout=httpx.Timeout(10.0, connect=5.0)) as client:
-            # Prefer HEAD to avoid large bodies; fallback to GET if disallowed
-            try:
-                resp = client.head(url, headers={"User-Agent": "quickshield-ce/0.1"})
-                if resp.status_code in (405, 501):  # method not allowed / not implemented
-                    resp = client.get(url, headers={"User-Agent": "quickshield-ce/0.1"})
-            except httpx.HTTPStatusError:
-                # if .head(…, follow_redirects=True) raises, try GET
-                resp = client.get(url, headers={"User-Agent": "quickshield-ce/0.1"})
-
-        hdrs = _lower_keys(resp.headers)
-        grade, issues = _score(hdrs)
-
-        sample = {
-            "strict-transport-security": hdrs.get("strict-transport-security", ""),
-            "content-security-policy": hdrs.get("content-security-policy", ""),
-            "x-content-type-options": hdrs.get("x-content-type-options", ""),
-            "x-frame-options": hdrs.get("x-frame-options", ""),
-            "referrer-policy": hdrs.get("referrer-policy", ""),
-            "permissions-policy": hdrs.get("permissions-policy", hdrs.get("feature-policy", "")),
-        }
-
-        ok = grade in ("A", "B")  # treat C/F as not ok
-        return HeadersCheckResult(
-            name=name, url=url, ok=ok, grade=grade, issues=issues, sample=sample, error=None
-        )
+        # Prefer HEAD to avoid large bodies; fallback to GET if disallowed
+        try:
+            resp = await client.head(url)
+            if resp.status_code in (405, 501):  # method not allowed / not implemented
+                resp = await _get_headers_only(client, url)
+        except httpx.HTTPStatusError:
+            # if .head(…, follow_redirects=True) raises, try GET
+            resp = await _get_headers_only(client, url)
+
+        return evaluate_headers(name, url, resp.headers)
     except Exception as e:
-        return HeadersCheckResult(
-            name=name, url=url, ok=False, grade="F", issues=["exception"], sample={}, error=str(e)
-        )
+        return headers_error_result(name, url, e)
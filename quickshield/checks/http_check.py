@@ -1,10 +1,14 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from time import monotonic
 from typing import Optional, Dict, Any
 import httpx
 
-@dataclass
+_CHUNK_SIZE = 8192
+# expect_keyword is only searched for in the first ~10M characters of the page
+_MAX_SCAN_CHARS = 10 * 1024 * 1024
+
+@dataclass(slots=True)
 class HttpCheckResult:
     name: str
     url: str
@@ -14,31 +18,61 @@ class HttpCheckResult:
     error: Optional[str]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "url": self.url,
+            "ok": self.ok,
+            "status_code": self.status_code,
+            "latency_ms": self.latency_ms,
+            "error": self.error,
+        }
 
-def run_http_check(name: str, url: str, expect_keyword: Optional[str] = None) -> HttpCheckResult:
-    start = monotonic()
-    try:
-        # Reasonable defaults: 10s total timeout, follow redirects
-        with httpx.Client(follow_redirects=True, timeout=httpx.Timeout(10.0, connect=5.0)) as client:
-            resp = client.get(url, headers={"User-Agent": "quickshield-ce/0.1"})
-            latency_ms = int((monotonic() - start) * 1000)
-            ok = 200 <= resp.status_code < 400
+async def _body_contains(resp: httpx.Response, keyword: str) -> bool:
+    # Scan the streamed body chunk by chunk, carrying a tail so matches that
+    # straddle a chunk boundary are still found; stop early on a hit or at the cap
+    tail = ""
+    scanned = 0
+    async for chunk in resp.aiter_text(chunk_size=_CHUNK_SIZE):
+        window = tail + chunk
+        if keyword in window:
+            return True
+        scanned += len(chunk)
+        if scanned >= _MAX_SCAN_CHARS:
+            return False
+        tail = window[-(len(keyword) - 1):] if len(keyword) > 1 else ""
+    return False
 
-            if ok and expect_keyword:
-                # If keyword is set, ensure it's present in the text
-                if expect_keyword not in resp.text:
-                    return HttpCheckResult(
-                        name=name, url=url, ok=False, status_code=resp.status_code,
-                        latency_ms=latency_ms, error=f"Keyword '{expect_keyword}' not found"
-                    )
+async def evaluate_http_response(
+    name: str, url: str, resp: httpx.Response, latency_ms: int, expect_keyword: Optional[str] = None
+) -> HttpCheckResult:
+    ok = 200 <= resp.status_code < 400
 
+    if ok and expect_keyword:
+        # If keyword is set, ensure it's present in the text
+        if not await _body_contains(resp, expect_keyword):
             return HttpCheckResult(
-                name=name, url=url, ok=ok, status_code=resp.status_code,
-                latency_ms=latency_ms, error=None if ok else "Non-OK status"
+                name=name, url=url, ok=False, status_code=resp.status_code,
+                latency_ms=latency_ms, error=f"Keyword '{expect_keyword}' not found"
             )
+
+    return HttpCheckResult(
+        name=name, url=url, ok=ok, status_code=resp.status_code,
+        latency_ms=latency_ms, error=None if ok else "Non-OK status"
+    )
+
+def http_error_result(name: str, url: str, latency_ms: int, error: Exception) -> HttpCheckResult:
+    return HttpCheckResult(
+        name=name, url=url, ok=False, status_code=None, latency_ms=latency_ms, error=str(error)
+    )
+
+async def run_http_check(
+    client: httpx.AsyncClient, name: str, url: str, expect_keyword: Optional[str] = None
+) -> HttpCheckResult:
+    start = monotonic()
+    try:
+        # Stream so the body is only read (incrementally) when we need the keyword
+        async with client.stream("GET", url) as resp:
+            latency_ms = int((monotonic() - start) * 1000)
+            return await evaluate_http_response(name, url, resp, latency_ms, expect_keyword)
     except Exception as e:
-        latency_ms = int((monotonic() - start) * 1000)
-        return HttpCheckResult(
-            name=name, url=url, ok=False, status_code=None, latency_ms=latency_ms, error=str(e)
-        )
+        return http_error_result(name, url, int((monotonic() - start) * 1000), e)
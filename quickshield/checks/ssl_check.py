@@ -1,11 +1,15 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any
-import socket
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Sequence, Set, Tuple
+import asyncio
+import contextlib
 import ssl
 from datetime import datetime, timezone
 
-@dataclass
+from .._dns_cache import DNS_CACHE
+from .._tls_cache import PeerCert, get_ssl_context, lookup_peer_cert, remember_peer_cert
+
+@dataclass(slots=True)
 class SslCheckResult:
     name: str
     host: str
@@ -17,35 +21,74 @@ class SslCheckResult:
     error: Optional[str]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "host": self.host,
+            "port": self.port,
+            "ok": self.ok,
+            "days_to_expiry": self.days_to_expiry,
+            "not_after": self.not_after,
+            "issuer": self.issuer,
+            "error": self.error,
+        }
+
+# Seconds allowed for address lookup + TCP connect + TLS handshake
+_CONNECT_TIMEOUT = 5
+
+async def _open_tls(
+    host: str, port: int, ips: Sequence[str]
+) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    # Try the addresses we were given (e.g. from the DNS check) first, then whatever the
+    # OS resolver returns for `host` (shared, cached lookup; the same addresses the HTTP
+    # transport connects to). SNI and hostname checks always use `host`.
+    tried: Set[str] = set()
+    error: Optional[OSError] = None
+    for candidates in (ips, None):
+        if candidates is None:  # everything we were given failed: fall back to the name
+            try:
+                candidates = await DNS_CACHE.addresses(host)
+            except OSError as e:
+                raise error or e
+        for address in candidates:
+            if address in tried:
+                continue
+            tried.add(address)
+            try:
+                return await asyncio.open_connection(
+                    address, port, ssl=get_ssl_context(), server_hostname=host
+                )
+            except ssl.SSLError:
+                raise  # the handshake itself failed; another address won't fix the certificate
+            except OSError as e:
+                error = e
+    raise error or OSError(f"No addresses found for {host}")
 
-def _parse_not_after(not_after_str: str) -> datetime:
-    # Typical format from getpeercert(): 'Oct  1 12:00:00 2025 GMT'
-    return datetime.strptime(not_after_str, "%b %d %H:%M:%S %Y %Z").replace(tzinfo=timezone.utc)
+async def _fetch_peer_cert(host: str, port: int, ips: Sequence[str] = ()) -> Optional[PeerCert]:
+    try:
+        reader, writer = await asyncio.wait_for(_open_tls(host, port, ips), timeout=_CONNECT_TIMEOUT)
+    except TimeoutError:
+        raise TimeoutError("timed out") from None  # same message the blocking socket gave
+    try:
+        return remember_peer_cert(host, port, writer.get_extra_info("ssl_object"))
+    finally:
+        writer.close()
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(writer.wait_closed(), timeout=_CONNECT_TIMEOUT)
 
-def run_ssl_check(name: str, host: str, port: int = 443) -> SslCheckResult:
+async def run_ssl_check(
+    name: str, host: str, port: int = 443, ips: Sequence[str] = ()
+) -> SslCheckResult:
     try:
-        ctx = ssl.create_default_context()
-        with socket.create_connection((host, port), timeout=5) as sock:
-            with ctx.wrap_socket(sock, server_hostname=host) as ssock:
-                cert = ssock.getpeercert()
-        # cert is a dict with fields like 'notAfter' and 'issuer'
-        not_after_raw = cert.get("notAfter")
-        if not not_after_raw:
+        # Reuse the certificate from an earlier handshake with this host:port if we have one;
+        # only the time-dependent expiry is recomputed
+        cert = lookup_peer_cert(host, port)
+        if cert is None:
+            cert = await _fetch_peer_cert(host, port, ips)
+        if cert is None or cert.not_after is None:
             return SslCheckResult(name, host, port, False, None, None, None, "no notAfter in cert")
 
-        not_after_dt = _parse_not_after(not_after_raw)
         now = datetime.now(timezone.utc)
-        delta_days = (not_after_dt - now).days
-
-        issuer_tuples = cert.get("issuer") or []
-        # issuer is a tuple of ((('commonName', 'X'),), (('organizationName','Y'),) ...)
-        issuer_parts = []
-        for rdn in issuer_tuples:
-            for k, v in rdn:
-                if k.lower() in ("commonname", "organizationname", "countryname"):
-                    issuer_parts.append(v)
-        issuer_str = ", ".join(issuer_parts) if issuer_parts else None
+        delta_days = (cert.not_after - now).days
 
         ok = delta_days >= 0
         return SslCheckResult(
@@ -53,9 +96,9 @@ def run_ssl_check(name: str, host: str, port: int = 443) -> SslCheckResult:
             host=host,
             port=port,
             ok=ok,
-            days_to_expiry=max(delta_days, 0) if delta_days is not None else None,
-            not_after=not_after_dt.isoformat(),
-            issuer=issuer_str,
+            days_to_expiry=max(delta_days, 0),
+            not_after=cert.not_after.isoformat(),
+            issuer=cert.issuer,
             error=None if ok else "certificate expired",
         )
     except Exception as e:
@@ -0,0 +1,26 @@
+from __future__ import annotations
+from time import monotonic
+from typing import Optional, Tuple
+import httpx
+
+from .http_check import HttpCheckResult, evaluate_http_response, http_error_result
+from .headers_check import HeadersCheckResult, evaluate_headers, headers_error_result
+
+async def run_web_check(
+    client: httpx.AsyncClient, name: str, url: str, expect_keyword: Optional[str] = None
+) -> Tuple[HttpCheckResult, HeadersCheckResult]:
+    # HTTP + headers checks answered from a single streamed GET (used when both are selected)
+    start = monotonic()
+    hdr_res: Optional[HeadersCheckResult] = None
+    try:
+        async with client.stream("GET", url) as resp:
+            latency_ms = int((monotonic() - start) * 1000)
+            hdr_res = evaluate_headers(name, url, resp.headers)
+            http_res = await evaluate_http_response(name, url, resp, latency_ms, expect_keyword)
+            return http_res, hdr_res
+    except Exception as e:
+        return (
+            http_error_result(name, url, int((monotonic() - start) * 1000), e),
+            # headers may already be graded if the failure came while reading the body
+            hdr_res or headers_error_result(name, url, e),
+        )
@@ -1,7 +1,8 @@
 from __future__ import annotations
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
-import yaml
+from typing import Any, Dict, List, Optional, Tuple
+import marshal
 
 DEFAULT_CONFIG = """\
 # QuickShield CE configuration
@@ -29,11 +30,25 @@ license:
   key: "CE"  # Community Edition
 """
 
+@dataclass(slots=True)
+class Site:
+    name: str
+    url: str
+    expect_keyword: Optional[str] = None
+
 def write_default_config(path: Path) -> None:
     path.write_text(DEFAULT_CONFIG, encoding="utf-8")
 
 def load_config(path: Path) -> Dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    import yaml  # deferred: `init` and `--version` never parse YAML
+    try:
+        # libyaml-backed loader when PyYAML was built with it; same safe semantics
+        from yaml import CSafeLoader as _Loader
+    except ImportError:
+        from yaml import SafeLoader as _Loader
+
+    # libyaml reads the raw bytes directly (UTF-8/16 detected), no separate decode pass
+    data = yaml.load(path.read_bytes(), Loader=_Loader)
     if not isinstance(data, dict):
         raise ValueError("Config root must be a mapping (YAML object).")
     return data
@@ -53,8 +68,46 @@ def basic_validate(cfg: Dict[str, Any]) -> List[str]:
             errors.append(f"site #{i} is missing `name`.")
         if not s.get("url"):
             errors.append(f"site #{i} is missing `url`.")
+        elif not isinstance(s["url"], str):
+            errors.append(f"site #{i} `url` must be a string.")
+        kw = s.get("expect_keyword")
+        if kw is not None and not isinstance(kw, str):
+            errors.append(f"site #{i} `expect_keyword` must be a string or null.")
         if "checks" not in s or not isinstance(s["checks"], dict):
             errors.append(f"site #{i} is missing `checks` mapping.")
 
     # alerts and license are optional in CE; we just ensure types if present
     return errors
+
+def load_config_cached(path: Path) -> Tuple[Dict[str, Any], List[str]]:
+    """load_config + basic_validate, reusing a cache beside the file while it's unchanged.
+
+    Scheduled runs re-read the same config every time; while its mtime and size match,
+    the parsed mapping comes from `<config>.cache` and YAML is never imported.
+    Validation always runs, so a newer, stricter validator sees cached configs too.
+    """
+    st = path.stat()
+    stamp = (marshal.version, st.st_mtime_ns, st.st_size)
+    cache_path = path.with_name(path.name + ".cache")
+    cfg: Any = None
+    try:
+        cached_stamp, cached_cfg = marshal.loads(cache_path.read_bytes())
+        if cached_stamp == stamp:
+            cfg = cached_cfg
+    except Exception:  # missing, truncated or from another version: just re-parse
+        pass
+
+    if cfg is None:
+        cfg = load_config(path)
+        try:
+            cache_path.write_bytes(marshal.dumps((stamp, cfg)))
+        except (OSError, ValueError):  # read-only folder, or values marshal can't hold (YAML dates)
+            pass
+    return cfg, basic_validate(cfg)
+
+def parse_sites(cfg: Dict[str, Any]) -> List[Site]:
+    """Typed view of `sites`; call only on a config that passed basic_validate."""
+    return [
+        Site(name=str(s["name"]), url=s["url"], expect_keyword=s.get("expect_keyword") or None)
+        for s in cfg["sites"]
+    ]
@@ -1,63 +1,70 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterable, Dict, Any, Tuple
 import csv
-import datetime as dt
-
-# Flatten the JSON-y results into one row per site
-def write_csv(results: List[Dict[str, Any]], outfile: Path) -> None:
-    # Define a stable column order (add/remove fields as you like)
-    fieldnames = [
-        "timestamp_iso",
-        "name", "url",
-        "http_ok", "http_status", "http_latency_ms", "http_error",
-        "ssl_ok", "ssl_days_to_expiry", "ssl_not_after", "ssl_issuer", "ssl_error",
-        "headers_ok", "headers_grade", "headers_issues_count", "headers_error",
-        "dns_ok", "dns_a_count", "dns_aaaa_count", "dns_cname_count", "dns_mx_count", "dns_hash", "dns_error",
-    ]
-
-    timestamp_iso = dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
-
-    rows = []
-    for r in results:
-        http = r.get("http", {}) or {}
-        ssl = r.get("ssl", {}) or {}
-        hdr = r.get("headers", {}) or {}
-        dns = r.get("dns", {}) or {}
-        recs = dns.get("records", {}) or {}
-
-        rows.append({
-            "timestamp_iso": timestamp_iso,
-            "name": r.get("name", ""),
-            "url": r.get("url", ""),
-
-            "http_ok": http.get("ok"),
-            "http_status": http.get("status_code"),
-            "http_latency_ms": http.get("latency_ms"),
-            "http_error": http.get("error"),
-
-            "ssl_ok": ssl.get("ok"),
-            "ssl_days_to_expiry": ssl.get("days_to_expiry"),
-            "ssl_not_after": ssl.get("not_after"),
-            "ssl_issuer": ssl.get("issuer"),
-            "ssl_error": ssl.get("error"),
-
-            "headers_ok": hdr.get("ok"),
-            "headers_grade": hdr.get("grade"),
-            "headers_issues_count": len(hdr.get("issues", []) or []),
-            "headers_error": hdr.get("error"),
-
-            "dns_ok": dns.get("ok"),
-            "dns_a_count": len(recs.get("A", []) or []),
-            "dns_aaaa_count": len(recs.get("AAAA", []) or []),
-            "dns_cname_count": len(recs.get("CNAME", []) or []),
-            "dns_mx_count": len(recs.get("MX", []) or []),
-            "dns_hash": dns.get("hash"),
-            "dns_error": dns.get("error"),
-        })
-
-    outfile.parent.mkdir(parents=True, exist_ok=True)
-    with outfile.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+
+# Define a stable column order (add/remove fields as you like)
+FIELDNAMES = [
+    "timestamp_iso",
+    "name", "url",
+    "http_ok", "http_status", "http_latency_ms", "http_error",
+    "ssl_ok", "ssl_days_to_expiry", "ssl_not_after", "ssl_issuer", "ssl_error",
+    "headers_ok", "headers_grade", "headers_issues_count", "headers_error",
+    "dns_ok", "dns_a_count", "dns_aaaa_count", "dns_cname_count", "dns_mx_count", "dns_hash", "dns_error",
+]
+
+# Flatten one site's JSON-y result into a single CSV row, in FIELDNAMES order
+def _site_row(r: Dict[str, Any], timestamp_iso: str) -> Tuple[Any, ...]:
+    http = r.get("http", {}) or {}
+    ssl = r.get("ssl", {}) or {}
+    hdr = r.get("headers", {}) or {}
+    dns = r.get("dns", {}) or {}
+    recs = dns.get("records", {}) or {}
+    recs_get = recs.get
+
+    return (
+        timestamp_iso,
+        r.get("name", ""),
+        r.get("url", ""),
+
+        http.get("ok"),
+        http.get("status_code"),
+        http.get("latency_ms"),
+        http.get("error"),
+
+        ssl.get("ok"),
+        ssl.get("days_to_expiry"),
+        ssl.get("not_after"),
+        ssl.get("issuer"),
+        ssl.get("error"),
+
+        hdr.get("ok"),
+        hdr.get("grade"),
+        len(hdr.get("issues") or ()),
+        hdr.get("error"),
+
+        dns.get("ok"),
+        len(recs_get("A") or ()),
+        len(recs_get("AAAA") or ()),
+        len(recs_get("CNAME") or ()),
+        len(recs_get("MX") or ()),
+        dns.get("hash"),
+        dns.get("error"),
+    )
+
+class CsvReportWriter:
+    """Writes one row per site to `outfile` as results come in."""
+
+    def __init__(self, outfile: Path, timestamp_iso: str) -> None:
+        self._timestamp_iso = timestamp_iso
+        outfile.parent.mkdir(parents=True, exist_ok=True)
+        self._f = outfile.open("w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._f)
+        self._writer.writerow(FIELDNAMES)
+
+    def write_many(self, results: Iterable[Dict[str, Any]]) -> None:
+        ts = self._timestamp_iso
+        self._writer.writerows(_site_row(r, ts) for r in results)
+
+    def close(self) -> None:
+        self._f.close()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Iterable, Dict, Any, List
+
+try:
+    import orjson
+except ImportError:  # optional speedup (`pip install quickshield[fast]`)
+    orjson = None
+    import json
+
+def _dumps_list(results: List[Dict[str, Any]]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    # Same layout as orjson's OPT_INDENT_2: two-space indent, UTF-8, no ASCII escaping
+    return json.dumps(results, indent=2, ensure_ascii=False).encode("utf-8")
+
+class JsonReportWriter:
+    """Writes site results to `outfile` as an indented JSON array, one element at a time."""
+
+    def __init__(self, outfile: Path) -> None:
+        outfile.parent.mkdir(parents=True, exist_ok=True)
+        self._f = outfile.open("wb")
+        self._count = 0
+
+    def write_many(self, results: Iterable[Dict[str, Any]]) -> None:
+        for r in results:
+            # dumps([r]) is b"[\n  {...}\n]"; keeping just the indented element means the
+            # finished file is byte-identical to dumping the whole list at once
+            element = _dumps_list([r])[2:-2]
+            self._f.write((b",\n" if self._count else b"[\n") + element)
+            self._count += 1
+
+    def close(self) -> None:
+        self._f.write(b"\n]" if self._count else b"[]")
+        self._f.close()
@@ -0,0 +1,250 @@
+from __future__ import annotations
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional, List, Dict, Any, FrozenSet, Awaitable, DefaultDict, Tuple
+from urllib.parse import urlsplit
+import asyncio
+import httpx
+# Private httpx helper (the parser httpx itself uses for proxy env vars); see the
+# version pin in pyproject.toml
+from httpx._utils import get_environment_proxies
+import typer
+
+from ._dns_cache import DNS_CACHE
+from ._tls_cache import get_ssl_context
+from ._transport import CachingTransport
+from .config import Site
+from .checks.http_check import run_http_check, HttpCheckResult
+from .checks.ssl_check import run_ssl_check, SslCheckResult
+from .checks.headers_check import run_headers_check, HeadersCheckResult
+from .checks.dns_check import run_dns_check, DnsCheckResult
+from .checks.web_check import run_web_check
+
+# Concurrency caps for `check`: checks in flight overall, and per host
+_MAX_CONCURRENCY = 50
+_MAX_PER_HOST = 8
+# Cap on DNS queries in flight across all hosts, so big configs don't swamp the resolver
+_MAX_DNS_QUERIES = 64
+
+def _status(text: str, ok: bool) -> str:
+    return typer.style(text, fg="green" if ok else "red")
+
+def _make_http_client() -> httpx.AsyncClient:
+    """One pooled client shared by the HTTP and headers checks across all sites."""
+    ssl_context = get_ssl_context()
+    limits = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+    # httpx only reads HTTP(S)_PROXY / ALL_PROXY / NO_PROXY when it builds the transport
+    # itself, so mount those proxies explicitly; None routes through the caching transport
+    mounts: Dict[str, Optional[httpx.AsyncBaseTransport]] = {
+        pattern: None if proxy is None else httpx.AsyncHTTPTransport(
+            verify=ssl_context, http2=True, limits=limits, proxy=proxy
+        )
+        for pattern, proxy in get_environment_proxies().items()
+    }
+    # Reasonable defaults: 10s total timeout, follow redirects
+    return httpx.AsyncClient(
+        transport=CachingTransport(DNS_CACHE, ssl_context=ssl_context, http2=True, limits=limits),
+        mounts=mounts,
+        follow_redirects=True,
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        headers={"User-Agent": "quickshield-ce/0.1"},
+    )
+
+def _ssl_endpoint(url: str) -> Tuple[str, int]:
+    """Hostname and TLS port for a site URL (443 unless an https URL names a port)."""
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    try:
+        port = parts.port if parts.scheme == "https" else None
+    except ValueError:  # malformed port; the HTTP check will report the bad URL
+        port = None
+    return host, port or 443
+
+async def _run_site(
+    client: Optional[httpx.AsyncClient],
+    s: Site,
+    selected_checks: FrozenSet[str],
+    global_sem: asyncio.Semaphore,
+    host_sems: DefaultDict[str, asyncio.Semaphore],
+    dns_slots: asyncio.Semaphore,
+) -> Dict[str, Any]:
+    """Run the selected checks for one site concurrently and print its results."""
+    name = s.name
+    url = s.url
+    expect_keyword = s.expect_keyword
+    host, port = _ssl_endpoint(url)
+
+    async def limited(coro: Awaitable[Any]) -> Any:
+        async with global_sem, host_sems[host]:
+            return await coro
+
+    async def ssl_after(
+        web: List[asyncio.Task[Any]], dns_task: Optional[asyncio.Task[DnsCheckResult]]
+    ) -> SslCheckResult:
+        # Let the HTTPS requests go first so the SSL check can reuse the certificate they
+        # saw, and the DNS check so a fresh handshake can try the addresses it found
+        waits: List[asyncio.Task[Any]] = web + ([dns_task] if dns_task is not None else [])
+        if waits:
+            await asyncio.wait(waits)
+        ips: List[str] = []
+        if dns_task is not None:
+            recs = dns_task.result().records
+            ips = (recs.get("A") or []) + (recs.get("AAAA") or [])
+        return await limited(run_ssl_check(name=name, host=host, port=port, ips=ips))
+
+    pending: Dict[str, asyncio.Task[Any]] = {}
+    if "http" in selected_checks and "headers" in selected_checks:
+        # One GET answers both checks
+        pending["web"] = asyncio.create_task(
+            limited(run_web_check(client, name=name, url=url, expect_keyword=expect_keyword))
+        )
+    elif "http" in selected_checks:
+        pending["http"] = asyncio.create_task(
+            limited(run_http_check(client, name=name, url=url, expect_keyword=expect_keyword))
+        )
+    elif "headers" in selected_checks:
+        pending["headers"] = asyncio.create_task(limited(run_headers_check(client, name=name, url=url)))
+    web = list(pending.values())
+    if "dns" in selected_checks:
+        pending["dns"] = asyncio.create_task(limited(run_dns_check(name=name, host=host, query_slots=dns_slots)))
+    if "ssl" in selected_checks:
+        pending["ssl"] = asyncio.create_task(ssl_after(web, pending.get("dns")))
+    done = dict(zip(pending, await asyncio.gather(*pending.values())))
+    if "web" in done:
+        done["http"], done["headers"] = done.pop("web")
+
+    site_result: Dict[str, Any] = {"name": name, "url": url}
+    # Collect the site's report and print it in one write, so concurrent sites don't interleave
+    lines: List[str] = []
+
+    # HTTP
+    if "http" in done:
+        http_res: HttpCheckResult = done["http"]
+        lines.append(f"→ HTTP:     {name} ({url})")
+        lines.append(_status(
+            f"   {'OK' if http_res.ok else 'FAIL'} | status={http_res.status_code} latency={http_res.latency_ms}ms"
+            + (f" error={http_res.error}" if http_res.error else ""),
+            http_res.ok,
+        ))
+        site_result["http"] = http_res.to_dict()
+
+    # SSL
+    if "ssl" in done:
+        ssl_res: SslCheckResult = done["ssl"]
+        lines.append(f"→ SSL:      {name} ({host}:{port})")
+        lines.append(_status(
+            f"   {'OK' if ssl_res.ok else 'FAIL'} |"
+            + (f" exp={ssl_res.days_to_expiry}d" if ssl_res.days_to_expiry is not None else "")
+            + (f" error={ssl_res.error}" if ssl_res.error else ""),
+            ssl_res.ok,
+        ))
+        site_result["ssl"] = ssl_res.to_dict()
+
+    # HEADERS
+    if "headers" in done:
+        hdr_res: HeadersCheckResult = done["headers"]
+        issues = hdr_res.issues
+        lines.append(f"→ HEADERS:  {name} ({url})")
+        lines.append(_status(
+            f"   grade={hdr_res.grade} " + (f"| issues={len(issues)}" if issues else ""),
+            hdr_res.ok,
+        ))
+        site_result["headers"] = hdr_res.to_dict()
+
+    # DNS
+    if "dns" in done:
+        dns_res: DnsCheckResult = done["dns"]
+        recs = dns_res.records
+        lines.append(f"→ DNS:      {name} ({host})")
+        lines.append(_status(
+            f"   {'OK' if dns_res.ok else 'FAIL'} | "
+            f"A={len(recs.get('A') or ())} "
+            f"AAAA={len(recs.get('AAAA') or ())} "
+            f"CNAME={len(recs.get('CNAME') or ())} "
+            f"MX={len(recs.get('MX') or ())}",
+            dns_res.ok,
+        ))
+        site_result["dns"] = dns_res.to_dict()
+
+    # echo (click's) strips the colors when stdout isn't a terminal and handles the Windows console
+    typer.echo("\n".join(lines), color=None)
+    return site_result
+
+async def _write_reports(
+    queue: asyncio.Queue[Optional[Dict[str, Any]]],
+    csv_outfile: Optional[Path],
+    json_outfile: Optional[Path],
+    timestamp_iso: str,
+) -> None:
+    """Append site results to the reports as they arrive, until a None sentinel."""
+    writers: List[Any] = []
+    try:
+        if csv_outfile is not None:
+            from .reporting.csv_report import CsvReportWriter
+            writers.append(CsvReportWriter(csv_outfile, timestamp_iso))
+        if json_outfile is not None:
+            from .reporting.json_report import JsonReportWriter
+            writers.append(JsonReportWriter(json_outfile))
+        while True:
+            # Take everything that has piled up and hand it to each writer in one call
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            finished = batch[-1] is None
+            if finished:
+                batch.pop()
+            for writer in writers:
+                writer.write_many(batch)
+            if finished:
+                return
+    finally:
+        for writer in writers:
+            writer.close()
+
+async def _run_all(
+    sites: List[Site],
+    selected_checks: FrozenSet[str],
+    timestamp_iso: str,
+    csv_outfile: Optional[Path],
+    json_outfile: Optional[Path],
+) -> None:
+    global_sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+    host_sems: DefaultDict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(_MAX_PER_HOST)
+    )
+    dns_slots = asyncio.Semaphore(_MAX_DNS_QUERIES)
+    queue: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue()
+    report_task = (
+        asyncio.create_task(_write_reports(queue, csv_outfile, json_outfile, timestamp_iso))
+        if csv_outfile or json_outfile else None
+    )
+
+    async def run_site(s: Site) -> None:
+        site_result = await _run_site(client, s, selected_checks, global_sem, host_sems, dns_slots)
+        if report_task is not None:
+            queue.put_nowait(site_result)
+
+    client = _make_http_client() if selected_checks & {"http", "headers"} else None
+    try:
+        await asyncio.gather(*(run_site(s) for s in sites))
+    finally:
+        if client is not None:
+            await client.aclose()
+        if report_task is not None:
+            queue.put_nowait(None)
+            await report_task
+
+def run_checks(
+    sites: List[Site],
+    selected_checks: FrozenSet[str],
+    timestamp_iso: str,
+    csv_outfile: Optional[Path] = None,
+    json_outfile: Optional[Path] = None,
+) -> None:
+    """Run every site concurrently, capped globally and per host, and print the results.
+
+    Each site is written to the CSV and/or JSON report as soon as it finishes (in
+    completion order), so results aren't held in memory and survive an interrupted run.
+    `timestamp_iso` is the run's UTC start time, stamped on every CSV row.
+    """
+    asyncio.run(_run_all(sites, selected_checks, timestamp_iso, csv_outfile, json_outfile))
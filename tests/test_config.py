@@ -0,0 +1,70 @@
+from __future__ import annotations
+from pathlib import Path
+import marshal
+import os
+
+from quickshield import config
+from quickshield.config import DEFAULT_CONFIG, load_config_cached
+
+def _forbid_yaml(monkeypatch) -> None:
+    def fail(path: Path) -> None:
+        raise AssertionError("config was re-parsed")
+    monkeypatch.setattr(config, "load_config", fail)
+
+def test_unchanged_config_is_served_from_the_cache(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "quickshield.yml"
+    path.write_text(DEFAULT_CONFIG, encoding="utf-8")
+    first, errors = load_config_cached(path)
+    assert errors == []
+    assert (tmp_path / "quickshield.yml.cache").exists()
+
+    _forbid_yaml(monkeypatch)
+    assert load_config_cached(path) == (first, [])
+
+def test_changed_config_is_parsed_again(tmp_path) -> None:
+    path = tmp_path / "quickshield.yaml"
+    path.write_text(DEFAULT_CONFIG, encoding="utf-8")
+    load_config_cached(path)
+    st = path.stat()
+
+    # Same size, new content and mtime
+    path.write_text(DEFAULT_CONFIG.replace("Araknitect", "Bravo-site"), encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    cfg, errors = load_config_cached(path)
+    assert errors == []
+    assert cfg["sites"][0]["name"] == "Bravo-site"
+
+def test_cached_config_is_still_validated(tmp_path, monkeypatch) -> None:
+    # e.g. a cache written before the validator got stricter
+    path = tmp_path / "quickshield.yml"
+    path.write_text(DEFAULT_CONFIG, encoding="utf-8")
+    st = path.stat()
+    stale = {"sites": [{"name": "x", "url": 42, "checks": {}}]}
+    (tmp_path / "quickshield.yml.cache").write_bytes(
+        marshal.dumps(((marshal.version, st.st_mtime_ns, st.st_size), stale))
+    )
+
+    _forbid_yaml(monkeypatch)
+    cfg, errors = load_config_cached(path)
+    assert cfg == stale
+    assert errors == ["site #1 `url` must be a string."]
+
+def test_unwritable_cache_falls_back_to_parsing(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "quickshield.yml"
+    path.write_text(DEFAULT_CONFIG, encoding="utf-8")
+
+    real_write_bytes = Path.write_bytes
+
+    def read_only(self: Path, data: bytes) -> int:
+        if self.name.endswith(".cache"):
+            raise PermissionError(13, "Permission denied", str(self))
+        return real_write_bytes(self, data)
+
+    # Simulates a read-only folder (chmod doesn't stop root, so patch the write)
+    monkeypatch.setattr(Path, "write_bytes", read_only)
+    for _ in range(2):
+        cfg, errors = load_config_cached(path)
+        assert errors == []
+        assert cfg["sites"][0]["name"] == "Araknitect"
+    assert not (tmp_path / "quickshield.yml.cache").exists()
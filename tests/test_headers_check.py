@@ -0,0 +1,27 @@
+from __future__ import annotations
+from typing import List
+
+import httpx
+
+from quickshield.checks.headers_check import evaluate_headers
+
+def _hsts_issues(value: str) -> List[str]:
+    res = evaluate_headers("site", "https://example.com/", httpx.Headers({"strict-transport-security": value}))
+    return [i for i in res.issues if "HSTS" in i or "Strict-Transport-Security" in i]
+
+def test_hsts_long_max_age_passes() -> None:
+    assert _hsts_issues("max-age=31536000; includeSubDomains") == []
+
+def test_hsts_short_max_age_is_flagged() -> None:
+    assert _hsts_issues("max-age=300") == ["HSTS max-age < 15552000"]
+
+def test_hsts_spaces_around_equals_are_accepted() -> None:
+    # RFC 6797 allows whitespace around "="; the old split/startswith parser rejected it
+    assert _hsts_issues("max-age = 31536000") == []
+
+def test_hsts_quoted_max_age_is_accepted() -> None:
+    assert _hsts_issues('max-age="31536000"') == []
+
+def test_hsts_prefixed_directive_is_not_max_age() -> None:
+    # "x-max-age" is a different (unknown) directive, not a max-age
+    assert _hsts_issues("x-max-age=31536000") == ["HSTS not parseable"]
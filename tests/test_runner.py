@@ -0,0 +1,26 @@
+from __future__ import annotations
+from typing import Tuple
+import asyncio
+
+from quickshield import runner
+from quickshield.checks import dns_check
+from quickshield.config import Site
+
+def test_run_checks_twice_in_one_process(monkeypatch, capsys) -> None:
+    # One query slot forces DNS lookups to queue on the semaphore; a semaphore shared
+    # between runs would then be bound to the first run's (closed) event loop, and the
+    # second run's lookups would fail (and be reported as no records)
+    monkeypatch.setattr(runner, "_MAX_DNS_QUERIES", 1)
+
+    async def fake_resolve(host: str, rdtype: str) -> Tuple[str, ...]:
+        await asyncio.sleep(0)
+        return (f"{rdtype}-answer",)
+
+    monkeypatch.setattr(dns_check.DNS_CACHE, "resolve", fake_resolve)
+    sites = [Site(name=f"s{i}", url=f"https://s{i}.example/") for i in range(3)]
+
+    for _ in range(2):
+        runner.run_checks(sites, frozenset({"dns"}), "2026-01-01T00:00:00Z")
+        out = capsys.readouterr().out
+        assert out.count("OK | A=1 AAAA=1 CNAME=1 MX=1") == len(sites)
+        assert "\x1b[" not in out  # no color codes when stdout isn't a terminal
@@ -0,0 +1,73 @@
+from __future__ import annotations
+from time import monotonic
+from typing import List, Tuple
+import asyncio
+
+from quickshield import _tls_cache
+from quickshield.checks import ssl_check
+
+def test_slow_address_lookup_counts_against_the_connect_timeout(monkeypatch) -> None:
+    async def slow_addresses(host: str) -> Tuple[str, ...]:
+        await asyncio.sleep(30)
+        return ("127.0.0.1",)
+
+    monkeypatch.setattr(ssl_check.DNS_CACHE, "addresses", slow_addresses)
+    monkeypatch.setattr(ssl_check, "_CONNECT_TIMEOUT", 0.2)
+
+    start = monotonic()
+    res = asyncio.run(ssl_check.run_ssl_check("site", "slow-dns.example"))
+
+    assert res.ok is False
+    assert res.error == "timed out"
+    assert monotonic() - start < 5
+
+class _FakeSSLObject:
+    def getpeercert(self, binary_form: bool = False):
+        if binary_form:
+            return b"fake-leaf-der"
+        return {"notAfter": "Jan  1 00:00:00 2099 GMT", "issuer": ((("commonName", "Test CA"),),)}
+
+class _FakeWriter:
+    def get_extra_info(self, info: str):
+        return _FakeSSLObject() if info == "ssl_object" else None
+
+    def close(self) -> None:
+        pass
+
+    async def wait_closed(self) -> None:
+        pass
+
+def _fake_network(monkeypatch, live: str, resolved: Tuple[str, ...]) -> List[str]:
+    """Only `live` accepts connections; returns the list of addresses tried."""
+    attempts: List[str] = []
+
+    async def open_connection(address: str, port: int, **kwargs):
+        attempts.append(address)
+        if address != live:
+            raise ConnectionRefusedError(111, f"Connect call failed ('{address}', {port})")
+        return None, _FakeWriter()
+
+    async def addresses(host: str) -> Tuple[str, ...]:
+        return resolved
+
+    monkeypatch.setattr(ssl_check.asyncio, "open_connection", open_connection)
+    monkeypatch.setattr(ssl_check.DNS_CACHE, "addresses", addresses)
+    monkeypatch.setattr(_tls_cache, "_PEER_CERTS", {})
+    return attempts
+
+def test_dead_first_address_falls_through_to_the_next(monkeypatch) -> None:
+    attempts = _fake_network(monkeypatch, live="127.0.0.1", resolved=())
+
+    res = asyncio.run(ssl_check.run_ssl_check("site", "multi.example", ips=["127.0.0.0", "127.0.0.1"]))
+
+    assert res.ok is True
+    assert res.issuer == "Test CA"
+    assert attempts == ["127.0.0.0", "127.0.0.1"]
+
+def test_falls_back_to_resolving_the_name_when_given_addresses_fail(monkeypatch) -> None:
+    attempts = _fake_network(monkeypatch, live="10.0.0.5", resolved=("127.0.0.0", "10.0.0.5"))
+
+    res = asyncio.run(ssl_check.run_ssl_check("site", "split.example", ips=["127.0.0.0"]))
+
+    assert res.ok is True
+    assert attempts == ["127.0.0.0", "10.0.0.5"]  # the failed address isn't retried
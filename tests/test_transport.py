@@ -0,0 +1,123 @@
+from __future__ import annotations
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List, Tuple
+import asyncio
+import ssl
+import threading
+
+import httpx
+import pytest
+
+from quickshield import runner
+from quickshield._dns_cache import DnsCache
+from quickshield._tls_cache import lookup_peer_cert
+from quickshield._transport import CachingTransport, _CertRecordingStream
+
+class _FakeDns(DnsCache):
+    """DnsCache that answers from a fixed table instead of the network."""
+
+    def __init__(self, table: dict) -> None:
+        super().__init__()
+        self.table = table
+        self.lookups: List[str] = []
+
+    async def addresses(self, host: str) -> Tuple[str, ...]:
+        self.lookups.append(host)
+        return self.table[host]
+
+class _Recorder(BaseHTTPRequestHandler):
+    requests: List[str] = []
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.requests.append(self.requestline)
+        body = b"hello"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_CONNECT(self) -> None:
+        # Act as a proxy that refuses every tunnel, so nothing leaves the machine
+        self.requests.append(self.requestline)
+        self.send_response(403)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+@pytest.fixture
+def server() -> Iterator[Tuple[int, List[str]]]:
+    requests: List[str] = []
+    handler = type("Handler", (_Recorder,), {"requests": requests})
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield srv.server_address[1], requests
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+async def _get(transport: httpx.AsyncBaseTransport, url: str) -> httpx.Response:
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await client.get(url)
+
+def test_connections_go_through_the_dns_cache(server) -> None:
+    port, requests = server
+    dns = _FakeDns({"quickshield.test": ("127.0.0.1",)})
+    transport = CachingTransport(dns, ssl_context=ssl.create_default_context())
+
+    # The OS can't resolve quickshield.test, so this only works via the cache
+    resp = asyncio.run(_get(transport, f"http://quickshield.test:{port}/"))
+
+    assert resp.status_code == 200
+    assert dns.lookups == ["quickshield.test"]
+    assert requests == ["GET / HTTP/1.1"]
+
+def test_dead_address_falls_through_to_the_next(server) -> None:
+    port, requests = server
+    # The server only listens on 127.0.0.1, so 127.0.0.2 refuses the connection
+    dns = _FakeDns({"quickshield.test": ("127.0.0.2", "127.0.0.1")})
+    transport = CachingTransport(dns, ssl_context=ssl.create_default_context())
+
+    resp = asyncio.run(_get(transport, f"http://quickshield.test:{port}/"))
+
+    assert resp.status_code == 200
+    assert len(requests) == 1
+
+def test_https_proxy_from_environment_is_used(server, monkeypatch) -> None:
+    port, requests = server
+    monkeypatch.setenv("HTTPS_PROXY", f"http://127.0.0.1:{port}")
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.delenv("no_proxy", raising=False)
+
+    async def fetch() -> None:
+        async with runner._make_http_client() as client:
+            await client.get("https://quickshield.invalid/")
+
+    with pytest.raises(httpx.ProxyError):
+        asyncio.run(fetch())
+    assert requests == ["CONNECT quickshield.invalid:443 HTTP/1.1"]
+
+class _OddCertSSLObject:
+    def getpeercert(self, binary_form: bool = False):
+        if binary_form:
+            return b"odd-leaf-der"
+        return {"notAfter": "Oct  1 12:00:00.5 2025 GMT"}  # fractional seconds: unparseable
+
+class _FakeTLSStream:
+    def get_extra_info(self, info: str):
+        return _OddCertSSLObject() if info == "ssl_object" else None
+
+class _FakeTCPStream:
+    async def start_tls(self, ssl_context, server_hostname=None, timeout=None):
+        return _FakeTLSStream()
+
+def test_unparseable_certificate_does_not_fail_the_connection() -> None:
+    stream = _CertRecordingStream(_FakeTCPStream(), 443)
+
+    tls = asyncio.run(stream.start_tls(ssl.create_default_context(), server_hostname="odd.example"))
+
+    assert isinstance(tls, _FakeTLSStream)
+    assert lookup_peer_cert("odd.example", 443) is None